@@ -1,20 +1,25 @@
+import codecs
+import ctypes
 import json
+import locale
+import os
 import re
 import sys
-import traceback
+from collections import deque
+from ctypes import wintypes
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Deque, Dict, Final, List, Mapping, Optional, Tuple
 
-from PyQt5.QtCore import QEasingCurve, QPropertyAnimation, QThread, QTimer, Qt, QUrl, pyqtSignal
-from PyQt5.QtGui import QDesktopServices, QFont
+from PyQt5.QtCore import QEasingCurve, QObject, QProcess, QPropertyAnimation, QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
 from PyQt5.QtWidgets import (
     QApplication,
     QAction,
     QActionGroup,
-    QButtonGroup,
     QCheckBox,
-    QComboBox,
     QFileDialog,
     QFormLayout,
     QGridLayout,
@@ -26,27 +31,186 @@ from PyQt5.QtWidgets import (
     QMainWindow,
     QMenu,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSizePolicy,
     QTextBrowser,
-    QTextEdit,
     QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
-
-def _app_dir() -> Path:
-    return Path(__file__).resolve().parent
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup
+    _json_loads = json.loads
+
+try:
+    import winreg
+except ImportError:  # not on Windows
+    winreg = None  # type: ignore[assignment]
+
+
+_WM_SETTINGCHANGE = 0x001A
+_MAX_PENDING_CHARS = 8192
+_LOG_MAX_BLOCKS = 10000
+_LOG_FLUSH_MS = 50
+
+
+def _char_format(color: str = "", bold: bool = False) -> QTextCharFormat:
+    fmt = QTextCharFormat()
+    if color:
+        fmt.setForeground(QColor(color))
+    if bold:
+        fmt.setFontWeight(QFont.Bold)
+    return fmt
+
+
+_FMT_PLAIN = _char_format()
+_FMT_NOTE = _char_format("#64748b")
+_FMT_ERROR = _char_format("#ef4444")
+_FMT_ERROR_BOLD = _char_format("#ef4444", bold=True)
+
+_MODULE_RE = re.compile(r"No module named ['\"]([^'\"]+)['\"]")
+# (lowercase token, translation key); an empty key marks an error without a hint.
+_ERROR_TOKENS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("modulenotfounderror", "err_module_not_found"),
+    ("no module named", "err_module_not_found"),
+    ("permissionerror", "err_permission"),
+    ("access is denied", "err_permission"),
+    ("syntaxerror", "err_syntax"),
+    ("error:", ""),
+    ("traceback", ""),
+)
+_ERROR_TOKEN_RE = re.compile("|".join(re.escape(token) for token, _ in _ERROR_TOKENS))
+_NOT_AN_ERROR: Final[Tuple[bool, str]] = (False, "")
+_ERROR_WITHOUT_HINT: Final[Tuple[bool, str]] = (True, "")
+
+
+_PALETTES: Final[Dict[str, Dict[str, str]]] = {
+    "dark": {
+        "fg": "#e6e6e6",
+        "text": "#e6e6e6",
+        "root_bg": "rgba(15,17,21,190)",
+        "surface": "#151924",
+        "group_bg": "transparent",
+        "border": "#2a2f3a",
+        "button_bg": "#1f6feb",
+        "disabled_bg": "#2a2f3a",
+        "disabled_fg": "#8892a6",
+        "menu_selected": "#2a2f3a",
+        "separator": "#2a2f3a",
+        "title_btn_hover": "#2a2f3a",
+        "title_btn_disabled_bg": "#11161f",
+        "title_btn_disabled_border": "#222836",
+        "title_btn_disabled_fg": "#6b7385",
+        "title_min_bg": "rgba(255,255,255,0.06)",
+        "title_min_fg": "white",
+        "title_min_hover": "rgba(255,255,255,0.10)",
+        "browser_bg": "#0f1115",
+        "link": "#60a5fa",
+    },
+    "light": {
+        "fg": "#1f2328",
+        "text": "#111827",
+        "root_bg": "rgba(246,247,251,210)",
+        "surface": "#ffffff",
+        "group_bg": "white",
+        "border": "#d7dbe6",
+        "button_bg": "#2563eb",
+        "disabled_bg": "#d7dbe6",
+        "disabled_fg": "#6b7280",
+        "menu_selected": "#eef2ff",
+        "separator": "#e5e7eb",
+        "title_btn_hover": "#f3f4f6",
+        "title_btn_disabled_bg": "#f3f4f6",
+        "title_btn_disabled_border": "#e5e7eb",
+        "title_btn_disabled_fg": "#9ca3af",
+        "title_min_bg": "rgba(0,0,0,0.05)",
+        "title_min_fg": "#111827",
+        "title_min_hover": "rgba(0,0,0,0.08)",
+        "browser_bg": "#f8fafc",
+        "link": "#2563eb",
+    },
+}
+
+_QSS_TEMPLATE: Final[str] = """
+    QWidget{{color:{fg};}}
+    QMainWindow{{background:transparent;}}
+    #root{{background:{root_bg};border-radius:14px;}}
+    QGroupBox{{border:1px solid {border};border-radius:8px;margin-top:12px;padding:8px;background:{group_bg};}}
+    QGroupBox::title{{subcontrol-origin: margin;subcontrol-position: top left;left:10px;top:0px;padding:0 6px;}}
+    QLineEdit,QTextEdit,QPlainTextEdit,QComboBox{{background:{surface};border:1px solid {border};border-radius:6px;padding:6px;}}
+    QPushButton{{background:{button_bg};border:none;border-radius:8px;padding:8px 12px;color:white;}}
+    QPushButton:disabled{{background:{disabled_bg};color:{disabled_fg};}}
+    QCheckBox{{spacing:8px;}}
+    QMenuBar{{background:transparent;border:none;padding:2px;}}
+    QMenuBar::item{{background:transparent;padding:6px 10px;border-radius:8px;}}
+    QMenuBar::item:selected{{background:{surface};}}
+    QMenu{{background:{surface};border:1px solid {border};border-radius:10px;padding:6px;}}
+    QMenu::item{{padding:6px 14px;border-radius:8px;}}
+    QMenu::item:selected{{background:{menu_selected};}}
+    TitleBar{{background:transparent;}}
+    #titleMenuBtn{{background:{surface};border:1px solid {border};border-radius:8px;padding:0 10px;color:{text};}}
+    #titleMenuBtn:hover{{background:{title_btn_hover};}}
+    #titleMenuBtn:disabled{{background:{title_btn_disabled_bg};border:1px solid {title_btn_disabled_border};color:{title_btn_disabled_fg};}}
+    #titleMin{{background:{title_min_bg};color:{title_min_fg};border-radius:8px;}}
+    #titleMin:hover{{background:{title_min_hover};}}
+    #titleClose{{background:#ef4444;color:white;border-radius:8px;}}
+    #titleClose:hover{{background:#dc2626;}}
+"""
+
+_MENU_QSS_TEMPLATE: Final[str] = """
+    QMenu{{background:{surface};color:{text};border:1px solid {border};border-radius:10px;padding:6px;}}
+    QMenu::item{{padding:6px 14px;border-radius:8px;}}
+    QMenu::item:selected{{background:{menu_selected};}}
+    QMenu::separator{{height:1px;background:{separator};margin:4px 10px;}}
+"""
+
+_MESSAGE_BOX_QSS_TEMPLATE: Final[str] = """
+    QMessageBox{{background:{surface};color:{text};}}
+    QLabel{{color:{text};}}
+    QPushButton{{background:{button_bg};border:none;border-radius:8px;padding:8px 12px;color:white;min-width:88px;}}
+"""
+
+_ABOUT_QSS_TEMPLATE: Final[str] = """
+    QDialog{{background:{surface};color:{text};}}
+    QTextBrowser{{background:{browser_bg};border:1px solid {border};border-radius:10px;padding:10px;color:{text};}}
+    QTextBrowser a{{color:{link};}}
+    QPushButton{{background:#2563eb;border:none;border-radius:8px;padding:8px 12px;color:white;}}
+"""
+
+
+def _render_qss(template: str) -> Dict[str, str]:
+    # Qt parses the sheet as given, so drop the indentation and newlines. Interned
+    # so the `is self._applied_qss` guards hold; PyQt still builds a fresh QString
+    # on every setStyleSheet call, so Qt itself sees no reuse.
+    return {
+        theme: sys.intern("".join(line.strip() for line in template.format(**palette).splitlines()))
+        for theme, palette in _PALETTES.items()
+    }
+
+
+_QSS: Final[Dict[str, str]] = _render_qss(_QSS_TEMPLATE)
+_MENU_QSS: Final[Dict[str, str]] = _render_qss(_MENU_QSS_TEMPLATE)
+_MESSAGE_BOX_QSS: Final[Dict[str, str]] = _render_qss(_MESSAGE_BOX_QSS_TEMPLATE)
+_ABOUT_QSS: Final[Dict[str, str]] = _render_qss(_ABOUT_QSS_TEMPLATE)
+
+
+_APP_DIR: Final[Path] = Path(__file__).resolve().parent
+_LANG_DIR: Final[Path] = _APP_DIR / "lang"
 
 
-def _lang_dir() -> Path:
-    return _app_dir() / "lang"
+def _load_json(path: Path) -> Dict[str, str]:
+    data = _json_loads(path.read_bytes())
+    return {sys.intern(k): v for k, v in data.items()}
 
 
-def _load_json(path: Path) -> Dict[str, str]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+@lru_cache(maxsize=8)
+def _load_lang_cached(code: str) -> Mapping[str, str]:
+    return MappingProxyType(_load_json(_LANG_DIR / f"{code}.json"))
 
 
 def _has_pyinstaller() -> bool:
@@ -58,66 +222,68 @@ def _has_pyinstaller() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def _default_upx_dir() -> Optional[str]:
-    exe = _app_dir() / "UPX.EXE"
+    exe = _APP_DIR / "UPX.EXE"
     if exe.exists():
         return str(exe.parent)
-    exe2 = _app_dir() / "upx.exe"
+    exe2 = _APP_DIR / "upx.exe"
     if exe2.exists():
         return str(exe2.parent)
     return None
 
 
-def _try_enable_windows_blur(hwnd: int) -> None:
-    try:
-        import ctypes
-        from ctypes import wintypes
-
-        class ACCENTPOLICY(ctypes.Structure):
-            _fields_ = [
-                ("AccentState", ctypes.c_int),
-                ("AccentFlags", ctypes.c_int),
-                ("GradientColor", ctypes.c_int),
-                ("AnimationId", ctypes.c_int),
-            ]
-
-        class WINCOMPATTRDATA(ctypes.Structure):
-            _fields_ = [
-                ("Attribute", ctypes.c_int),
-                ("Data", ctypes.c_void_p),
-                ("SizeOfData", ctypes.c_size_t),
-            ]
-
-        user32 = ctypes.windll.user32
-        set_window_comp_attr = getattr(user32, "SetWindowCompositionAttribute", None)
-        if not set_window_comp_attr:
-            return
+class _ACCENTPOLICY(ctypes.Structure):
+    _fields_ = [
+        ("AccentState", ctypes.c_int),
+        ("AccentFlags", ctypes.c_int),
+        ("GradientColor", ctypes.c_int),
+        ("AnimationId", ctypes.c_int),
+    ]
 
-        ACCENT_ENABLE_ACRYLICBLURBEHIND = 4
-        WCA_ACCENT_POLICY = 19
 
-        accent = ACCENTPOLICY()
-        accent.AccentState = ACCENT_ENABLE_ACRYLICBLURBEHIND
-        accent.AccentFlags = 2
-        accent.GradientColor = 0xCC202020
-        accent.AnimationId = 0
+class _WINCOMPATTRDATA(ctypes.Structure):
+    _fields_ = [
+        ("Attribute", ctypes.c_int),
+        ("Data", ctypes.c_void_p),
+        ("SizeOfData", ctypes.c_size_t),
+    ]
+
+
+_ACCENT_ENABLE_ACRYLICBLURBEHIND = 4
+_WCA_ACCENT_POLICY = 19
+
+_SetWindowCompositionAttribute = None
+_ACCENT = _ACCENTPOLICY(_ACCENT_ENABLE_ACRYLICBLURBEHIND, 2, 0xCC202020, 0)
+_ACCENT_DATA = _WINCOMPATTRDATA(
+    _WCA_ACCENT_POLICY,
+    ctypes.cast(ctypes.pointer(_ACCENT), ctypes.c_void_p),
+    ctypes.sizeof(_ACCENT),
+)
+
+if sys.platform == "win32":
+    try:
+        _SetWindowCompositionAttribute = getattr(ctypes.windll.user32, "SetWindowCompositionAttribute", None)
+        if _SetWindowCompositionAttribute is not None:
+            _SetWindowCompositionAttribute.argtypes = [wintypes.HWND, ctypes.POINTER(_WINCOMPATTRDATA)]
+            _SetWindowCompositionAttribute.restype = wintypes.BOOL
+    except Exception:
+        _SetWindowCompositionAttribute = None
 
-        data = WINCOMPATTRDATA()
-        data.Attribute = WCA_ACCENT_POLICY
-        data.Data = ctypes.cast(ctypes.pointer(accent), ctypes.c_void_p)
-        data.SizeOfData = ctypes.sizeof(accent)
 
-        set_window_comp_attr.argtypes = [wintypes.HWND, ctypes.POINTER(WINCOMPATTRDATA)]
-        set_window_comp_attr.restype = wintypes.BOOL
-        set_window_comp_attr(hwnd, ctypes.byref(data))
+def _try_enable_windows_blur(hwnd: int) -> None:
+    if _SetWindowCompositionAttribute is None:
+        return
+    try:
+        _SetWindowCompositionAttribute(hwnd, ctypes.byref(_ACCENT_DATA))
     except Exception:
         return
 
 
 def _read_windows_apps_theme() -> Optional[str]:
+    if winreg is None:
+        return None
     try:
-        import winreg
-
         key_path = r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
         with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as k:
             value, _ = winreg.QueryValueEx(k, "AppsUseLightTheme")
@@ -161,20 +327,7 @@ class AboutDialog(QDialog):
         self.apply_theme(theme)
 
     def apply_theme(self, theme: str) -> None:
-        if theme == "dark":
-            self.setStyleSheet(
-                "QDialog{background:#151924;color:#e6e6e6;}"
-                "QTextBrowser{background:#0f1115;border:1px solid #2a2f3a;border-radius:10px;padding:10px;color:#e6e6e6;}"
-                "QTextBrowser a{color:#60a5fa;}"
-                "QPushButton{background:#2563eb;border:none;border-radius:8px;padding:8px 12px;color:white;}"
-            )
-        else:
-            self.setStyleSheet(
-                "QDialog{background:#ffffff;color:#111827;}"
-                "QTextBrowser{background:#f8fafc;border:1px solid #d7dbe6;border-radius:10px;padding:10px;color:#111827;}"
-                "QTextBrowser a{color:#2563eb;}"
-                "QPushButton{background:#2563eb;border:none;border-radius:8px;padding:8px 12px;color:white;}"
-            )
+        self.setStyleSheet(_ABOUT_QSS[theme])
 
 
 class TitleBar(QWidget):
@@ -239,7 +392,25 @@ class TitleBar(QWidget):
         event.accept()
 
 
-@dataclass
+# BuildOptions field -> PyInstaller option, passed only when the field is set.
+_PAIR_OPTS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("name", "--name"),
+    ("icon", "--icon"),
+    ("specpath", "--specpath"),
+    ("workpath", "--workpath"),
+    ("distpath", "--distpath"),
+)
+_BOOL_FLAGS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("uac_admin", "--uac-admin"),
+    ("clean", "--clean"),
+    ("noconfirm", "-y"),
+)
+
+# dataclass(slots=...) needs Python 3.10+; older interpreters keep a __dict__.
+_DATACLASS_SLOTS: Final[Dict[str, bool]] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class BuildOptions:
     py_file: str
     output_dir: str
@@ -257,70 +428,112 @@ class BuildOptions:
     distpath: str
 
 
-class PyInstallerWorker(QThread):
-    line = pyqtSignal(str)
+class PyInstallerWorker(QObject):
+    lines = pyqtSignal(str)  # one or more newline-separated output lines
     finished_with_code = pyqtSignal(int)
 
-    def __init__(self, args: List[str], cwd: str):
-        super().__init__()
+    def __init__(self, args: List[str], cwd: str, parent: Optional[QObject] = None):
+        super().__init__(parent)
         self._args = args
-        self._cwd = cwd
-        self._proc = None
-
-    def run(self) -> None:
-        try:
-            import subprocess
-
-            self._proc = subprocess.Popen(
-                self._args,
-                cwd=self._cwd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-            )
-
-            assert self._proc.stdout is not None
-            for raw in self._proc.stdout:
-                if raw is None:
-                    continue
-                self.line.emit(raw.rstrip("\n"))
-
-            code = self._proc.wait()
-            self.finished_with_code.emit(code)
-        except Exception:
-            self.line.emit(traceback.format_exc())
-            self.finished_with_code.emit(-1)
+        self._decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+        self._pending = ""
+
+        self._proc = QProcess(self)
+        self._proc.setProcessChannelMode(QProcess.MergedChannels)
+        self._proc.setWorkingDirectory(cwd)
+        self._proc.readyReadStandardOutput.connect(self._on_ready_read)
+        self._proc.finished[int, QProcess.ExitStatus].connect(self._on_proc_finished)
+        self._proc.errorOccurred.connect(self._on_proc_error)
+
+    def start(self) -> None:
+        self._proc.start(self._args[0], self._args[1:])
+
+    def _on_ready_read(self) -> None:
+        self._pending += self._decoder.decode(self._proc.readAllStandardOutput().data())
+        # Emit every complete line that arrived together; keep a trailing
+        # partial line unless it grows too long.
+        head, sep, tail = self._pending.rpartition("\n")
+        if sep:
+            self.lines.emit(head)
+            self._pending = tail
+        elif len(self._pending) >= _MAX_PENDING_CHARS:
+            self.lines.emit(self._pending)
+            self._pending = ""
+
+    def _flush(self) -> None:
+        self._pending += self._decoder.decode(b"", final=True)
+        if self._pending:
+            self.lines.emit(self._pending)
+            self._pending = ""
+
+    def _on_proc_finished(self, code: int, status: QProcess.ExitStatus) -> None:
+        self._on_ready_read()
+        self._flush()
+        if status == QProcess.CrashExit and code == 0:
+            code = -1
+        self.finished_with_code.emit(code)
+
+    def _on_proc_error(self, error: QProcess.ProcessError) -> None:
+        if error != QProcess.FailedToStart:
+            return
+        self.lines.emit(self._proc.errorString())
+        self.finished_with_code.emit(-1)
 
     def cancel(self) -> None:
-        try:
-            if self._proc is None:
-                return
-            if self._proc.poll() is not None:
-                return
+        if self._proc.state() == QProcess.NotRunning:
+            return
+        if sys.platform == "win32":
+            # terminate() only posts WM_CLOSE, which console processes ignore.
+            self._proc.kill()
+        else:
             self._proc.terminate()
-        except Exception:
-            pass
 
 
 class MainWindow(QMainWindow):
+    _QSS: Dict[str, str] = _QSS
+    _MENU_QSS: Dict[str, str] = _MENU_QSS
+
     def __init__(self):
         super().__init__()
 
-        self._lang: Dict[str, str] = {}
+        self._lang: Mapping[str, str] = {}
+        self._err_formats: Dict[str, str] = {}
         self._lang_code = "zh_CN"
         self._theme = "light"  # applied theme: 'light' | 'dark'
         self._theme_mode = "system"  # 'system' | 'light' | 'dark'
         self._worker: Optional[PyInstallerWorker] = None
-        self._fade_anim: Optional[QPropertyAnimation] = None
+        self._fade_anim = QPropertyAnimation(self, b"windowOpacity", self)
+        self._fade_anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._did_fade_in = False
+        self._applied_qss: Optional[str] = None
+        self._applied_menu_qss: Optional[str] = None
+        self._last_sys_theme: Optional[str] = None
+        self._msgbox_cache: Dict[str, QMessageBox] = {}
+        self._drag_path: Optional[str] = None
+        self._last_dir = ""
+
+        # Log output is queued and written at most every _LOG_FLUSH_MS; the
+        # deque drops lines the block limit would trim anyway.
+        self._log_buffer: Deque[Tuple[Tuple[str, QTextCharFormat], ...]] = deque(maxlen=_LOG_MAX_BLOCKS)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(_LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
 
         self.setWindowFlags(Qt.Window | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setAcceptDrops(True)
         self._build_ui()
+
+        # Let the window show first; texts, theme and blur land on the next tick.
+        QTimer.singleShot(0, self._post_init)
+
+    def _post_init(self) -> None:
         self._load_language(self._lang_code)
-        self._apply_theme(self._get_effective_theme())
+        self._set_language(self._lang_code)
+        self._set_theme_mode(self._theme_mode)
+        # _set_theme_mode skips the apply when the target equals the initial "light".
+        self._apply_theme(self._theme)
         self._sync_enabled_state(running=False)
         self._on_use_upx_toggled(self.ck_use_upx.isChecked())
 
@@ -330,11 +543,6 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        self._theme_timer = QTimer(self)
-        self._theme_timer.setInterval(1200)
-        self._theme_timer.timeout.connect(self._poll_system_theme)
-        self._theme_timer.start()
-
     def _build_ui(self) -> None:
         central = QWidget(self)
         central.setObjectName("root")
@@ -363,19 +571,11 @@ class MainWindow(QMainWindow):
         files_layout.setHorizontalSpacing(10)
         files_layout.setVerticalSpacing(8)
 
-        self.ed_py = QLineEdit()
-        self.btn_py = QPushButton()
-        py_row = QHBoxLayout()
-        py_row.addWidget(self.ed_py)
-        py_row.addWidget(self.btn_py)
+        self.ed_py, self.btn_py, py_row = self._make_browse_row()
         self.lbl_py_file = QLabel()
         files_layout.addRow(self.lbl_py_file, py_row)
 
-        self.ed_out = QLineEdit()
-        self.btn_out = QPushButton()
-        out_row = QHBoxLayout()
-        out_row.addWidget(self.ed_out)
-        out_row.addWidget(self.btn_out)
+        self.ed_out, self.btn_out, out_row = self._make_browse_row()
         self.lbl_output_dir = QLabel()
         files_layout.addRow(self.lbl_output_dir, out_row)
 
@@ -391,18 +591,14 @@ class MainWindow(QMainWindow):
 
         self.rb_onefile = QCheckBox()
         self.rb_onedir = QCheckBox()
-        self._mode_group = QButtonGroup(self)
-        self._mode_group.setExclusive(True)
-        self._mode_group.addButton(self.rb_onefile)
-        self._mode_group.addButton(self.rb_onedir)
+        self.rb_onefile.toggled.connect(lambda v: self._on_pair_toggled(self.rb_onefile, self.rb_onedir, v))
+        self.rb_onedir.toggled.connect(lambda v: self._on_pair_toggled(self.rb_onedir, self.rb_onefile, v))
         self.rb_onefile.setChecked(True)
 
         self.rb_console = QCheckBox()
         self.rb_windowed = QCheckBox()
-        self._console_group = QButtonGroup(self)
-        self._console_group.setExclusive(True)
-        self._console_group.addButton(self.rb_console)
-        self._console_group.addButton(self.rb_windowed)
+        self.rb_console.toggled.connect(lambda v: self._on_pair_toggled(self.rb_console, self.rb_windowed, v))
+        self.rb_windowed.toggled.connect(lambda v: self._on_pair_toggled(self.rb_windowed, self.rb_console, v))
         self.rb_windowed.setChecked(True)
 
         basic_layout.addWidget(self.rb_onefile, 0, 0)
@@ -411,11 +607,7 @@ class MainWindow(QMainWindow):
         basic_layout.addWidget(self.rb_windowed, 1, 1)
 
         self.ed_name = QLineEdit()
-        self.ed_icon = QLineEdit()
-        self.btn_icon = QPushButton()
-        icon_row = QHBoxLayout()
-        icon_row.addWidget(self.ed_icon)
-        icon_row.addWidget(self.btn_icon)
+        self.ed_icon, self.btn_icon, icon_row = self._make_browse_row()
 
         self.lbl_name = QLabel()
         basic_layout.addWidget(self.lbl_name, 2, 0)
@@ -435,11 +627,7 @@ class MainWindow(QMainWindow):
         self.ck_clean = QCheckBox()
         self.ck_noconfirm = QCheckBox()
         self.ck_use_upx = QCheckBox()
-        self.ed_upx_dir = QLineEdit()
-        self.btn_upx_dir = QPushButton()
-        upx_row = QHBoxLayout()
-        upx_row.addWidget(self.ed_upx_dir)
-        upx_row.addWidget(self.btn_upx_dir)
+        self.ed_upx_dir, self.btn_upx_dir, upx_row = self._make_browse_row()
 
         opt_layout.addWidget(self.ck_uac, 0, 0)
         opt_layout.addWidget(self.ck_clean, 0, 1)
@@ -456,23 +644,9 @@ class MainWindow(QMainWindow):
         paths_layout.setHorizontalSpacing(10)
         paths_layout.setVerticalSpacing(8)
 
-        self.ed_specpath = QLineEdit()
-        self.btn_specpath = QPushButton()
-        spec_row = QHBoxLayout()
-        spec_row.addWidget(self.ed_specpath)
-        spec_row.addWidget(self.btn_specpath)
-
-        self.ed_workpath = QLineEdit()
-        self.btn_workpath = QPushButton()
-        work_row = QHBoxLayout()
-        work_row.addWidget(self.ed_workpath)
-        work_row.addWidget(self.btn_workpath)
-
-        self.ed_distpath = QLineEdit()
-        self.btn_distpath = QPushButton()
-        dist_row = QHBoxLayout()
-        dist_row.addWidget(self.ed_distpath)
-        dist_row.addWidget(self.btn_distpath)
+        self.ed_specpath, self.btn_specpath, spec_row = self._make_browse_row()
+        self.ed_workpath, self.btn_workpath, work_row = self._make_browse_row()
+        self.ed_distpath, self.btn_distpath, dist_row = self._make_browse_row()
 
         self.lbl_specpath = QLabel()
         self.lbl_workpath = QLabel()
@@ -497,8 +671,10 @@ class MainWindow(QMainWindow):
 
         self.grp_log = QGroupBox()
         log_layout = QVBoxLayout(self.grp_log)
-        self.txt_log = QTextEdit()
+        self.txt_log = QPlainTextEdit()
         self.txt_log.setReadOnly(True)
+        self.txt_log.setMaximumBlockCount(_LOG_MAX_BLOCKS)
+        self.txt_log.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.txt_log.setFont(QFont("Consolas", 10))
         log_layout.addWidget(self.txt_log)
         root.addWidget(self.grp_log)
@@ -512,9 +688,30 @@ class MainWindow(QMainWindow):
         self.btn_upx_dir.clicked.connect(lambda: self._pick_dir(self.ed_upx_dir))
         self.btn_start.clicked.connect(self._start)
         self.btn_cancel.clicked.connect(self._cancel)
-        self.btn_clear.clicked.connect(self.txt_log.clear)
+        self.btn_clear.clicked.connect(self._clear_log)
         self.ck_use_upx.toggled.connect(self._on_use_upx_toggled)
 
+        self._build_toggleable_widgets()
+
+    @staticmethod
+    def _make_browse_row() -> Tuple[QLineEdit, QPushButton, QHBoxLayout]:
+        edit = QLineEdit()
+        button = QPushButton()
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(edit)
+        row.addWidget(button)
+        return edit, button, row
+
+    @staticmethod
+    def _on_pair_toggled(box: QCheckBox, other: QCheckBox, checked: bool) -> None:
+        # Behave like an exclusive group: checking a box clears its partner,
+        # unchecking the selected box is undone.
+        target, state = (other, False) if checked else (box, True)
+        target.blockSignals(True)
+        target.setChecked(state)
+        target.blockSignals(False)
+
     def _build_menu(self) -> None:
         self.menu_settings = QMenu(self)
         self.menu_language = QMenu(self.menu_settings)
@@ -565,191 +762,134 @@ class MainWindow(QMainWindow):
         self.menu_help.addAction(self.act_about)
         self.act_about.triggered.connect(self._show_about)
 
-        self.title_bar.set_menus(self.menu_settings, self.menu_help)
+        self._lang_actions = {"zh_CN": self.act_lang_zh, "en_US": self.act_lang_en}
+        self._theme_actions = {
+            "system": self.act_theme_system,
+            "light": self.act_theme_light,
+            "dark": self.act_theme_dark,
+        }
 
-        self._set_language(self._lang_code)
-        self._set_theme_mode(self._theme_mode)
+        self.title_bar.set_menus(self.menu_settings, self.menu_help)
 
     def _t(self, key: str) -> str:
         return self._lang.get(key, key)
 
     def _load_language(self, code: str) -> None:
-        path = _lang_dir() / f"{code}.json"
-        self._lang = _load_json(path)
+        self._lang = _load_lang_cached(code)
         self._lang_code = code
+        self._err_formats = {key: self._t(key) for _, key in _ERROR_TOKENS if key}
         self._apply_texts()
 
     def _apply_texts(self) -> None:
-        self.setWindowTitle(self._t("app_title"))
-        self.grp_files.setTitle(self._t("group_files"))
-        self.grp_basic.setTitle(self._t("group_basic"))
-        self.grp_opt.setTitle(self._t("group_opt"))
-        self.grp_paths.setTitle(self._t("group_paths"))
-        self.grp_log.setTitle(self._t("group_log"))
-
-        self.title_bar.lbl_title.setText(self._t("app_title"))
-
-        self.lbl_py_file.setText(self._t("lbl_py_file"))
-        self.lbl_output_dir.setText(self._t("lbl_output_dir"))
-
-        self.btn_py.setText(self._t("btn_browse"))
-        self.btn_out.setText(self._t("btn_browse"))
-
-        self.menu_settings.setTitle(self._t("menu_settings"))
-        self.menu_language.setTitle(self._t("menu_language"))
-        self.menu_theme.setTitle(self._t("menu_theme"))
-        self.menu_help.setTitle(self._t("menu_help"))
-
-        self.title_bar.btn_settings.setText(self._t("menu_settings"))
-        self.title_bar.btn_help.setText(self._t("menu_help"))
-
-        self.act_lang_zh.setText(self._t("lang_zh"))
-        self.act_lang_en.setText(self._t("lang_en"))
-        self.act_theme_system.setText(self._t("theme_system"))
-        self.act_theme_light.setText(self._t("theme_light"))
-        self.act_theme_dark.setText(self._t("theme_dark"))
-        self.act_about.setText(self._t("menu_about"))
-
-        self.rb_onefile.setText(self._t("opt_onefile"))
-        self.rb_onedir.setText(self._t("opt_onedir"))
-        self.rb_console.setText(self._t("opt_console"))
-        self.rb_windowed.setText(self._t("opt_windowed"))
-
-        self.lbl_name.setText(self._t("lbl_name"))
-        self.lbl_icon.setText(self._t("lbl_icon"))
-        self.btn_icon.setText(self._t("btn_browse"))
-
-        self.ck_uac.setText(self._t("opt_uac_admin"))
-        self.ck_clean.setText(self._t("opt_clean"))
-        self.ck_noconfirm.setText(self._t("opt_noconfirm"))
-        self.ck_use_upx.setText(self._t("opt_use_upx"))
-
-        self.lbl_upx_dir.setText(self._t("lbl_upx_dir"))
-        self.btn_upx_dir.setText(self._t("btn_browse"))
-
-        self.lbl_specpath.setText(self._t("lbl_specpath"))
-        self.lbl_workpath.setText(self._t("lbl_workpath"))
-        self.lbl_distpath.setText(self._t("lbl_distpath"))
-        self.btn_specpath.setText(self._t("btn_browse"))
-        self.btn_workpath.setText(self._t("btn_browse"))
-        self.btn_distpath.setText(self._t("btn_browse"))
-
-        self.btn_start.setText(self._t("btn_start"))
-        self.btn_cancel.setText(self._t("btn_cancel"))
-        self.btn_clear.setText(self._t("btn_clear"))
-
-        if not self._worker:
-            self.lbl_status.setText(self._t("status_ready"))
+        self.setUpdatesEnabled(False)
+        try:
+            self.setWindowTitle(self._t("app_title"))
+            self.grp_files.setTitle(self._t("group_files"))
+            self.grp_basic.setTitle(self._t("group_basic"))
+            self.grp_opt.setTitle(self._t("group_opt"))
+            self.grp_paths.setTitle(self._t("group_paths"))
+            self.grp_log.setTitle(self._t("group_log"))
+
+            self.title_bar.lbl_title.setText(self._t("app_title"))
+            self.title_bar.btn_settings.setText(self._t("menu_settings"))
+            self.title_bar.btn_help.setText(self._t("menu_help"))
+
+            self.lbl_py_file.setText(self._t("lbl_py_file"))
+            self.lbl_output_dir.setText(self._t("lbl_output_dir"))
+
+            self.btn_py.setText(self._t("btn_browse"))
+            self.btn_out.setText(self._t("btn_browse"))
+
+            self.menu_settings.setTitle(self._t("menu_settings"))
+            self.menu_language.setTitle(self._t("menu_language"))
+            self.menu_theme.setTitle(self._t("menu_theme"))
+            self.menu_help.setTitle(self._t("menu_help"))
+
+            self.act_lang_zh.setText(self._t("lang_zh"))
+            self.act_lang_en.setText(self._t("lang_en"))
+            self.act_theme_system.setText(self._t("theme_system"))
+            self.act_theme_light.setText(self._t("theme_light"))
+            self.act_theme_dark.setText(self._t("theme_dark"))
+            self.act_about.setText(self._t("menu_about"))
+
+            self.rb_onefile.setText(self._t("opt_onefile"))
+            self.rb_onedir.setText(self._t("opt_onedir"))
+            self.rb_console.setText(self._t("opt_console"))
+            self.rb_windowed.setText(self._t("opt_windowed"))
+
+            self.lbl_name.setText(self._t("lbl_name"))
+            self.lbl_icon.setText(self._t("lbl_icon"))
+            self.btn_icon.setText(self._t("btn_browse"))
+
+            self.ck_uac.setText(self._t("opt_uac_admin"))
+            self.ck_clean.setText(self._t("opt_clean"))
+            self.ck_noconfirm.setText(self._t("opt_noconfirm"))
+            self.ck_use_upx.setText(self._t("opt_use_upx"))
+
+            self.lbl_upx_dir.setText(self._t("lbl_upx_dir"))
+            self.btn_upx_dir.setText(self._t("btn_browse"))
+
+            self.lbl_specpath.setText(self._t("lbl_specpath"))
+            self.lbl_workpath.setText(self._t("lbl_workpath"))
+            self.lbl_distpath.setText(self._t("lbl_distpath"))
+            self.btn_specpath.setText(self._t("btn_browse"))
+            self.btn_workpath.setText(self._t("btn_browse"))
+            self.btn_distpath.setText(self._t("btn_browse"))
+
+            self.btn_start.setText(self._t("btn_start"))
+            self.btn_cancel.setText(self._t("btn_cancel"))
+            self.btn_clear.setText(self._t("btn_clear"))
+
+            if not self._worker:
+                self.lbl_status.setText(self._t("status_ready"))
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _apply_theme(self, theme: str) -> None:
+        style = self._QSS[theme]
+        if style is self._applied_qss:
+            return
         self._theme = theme
-        if theme == "dark":
-            self.setStyleSheet(
-                "QWidget{color:#e6e6e6;}"
-                "QMainWindow{background:transparent;}"
-                "#root{background:rgba(15,17,21,190);border-radius:14px;}"
-                "QGroupBox{border:1px solid #2a2f3a;border-radius:8px;margin-top:12px;padding:8px;}"
-                "QGroupBox::title{subcontrol-origin: margin;subcontrol-position: top left;left:10px;top:0px;padding:0 6px;}"
-                "QLineEdit,QTextEdit,QComboBox{background:#151924;border:1px solid #2a2f3a;border-radius:6px;padding:6px;}"
-                "QPushButton{background:#1f6feb;border:none;border-radius:8px;padding:8px 12px;color:white;}"
-                "QPushButton:disabled{background:#2a2f3a;color:#8892a6;}"
-                "QCheckBox{spacing:8px;}"
-                "QMenuBar{background:transparent;border:none;padding:2px;}"
-                "QMenuBar::item{background:transparent;padding:6px 10px;border-radius:8px;}"
-                "QMenuBar::item:selected{background:#151924;}"
-                "QMenu{background:#151924;border:1px solid #2a2f3a;border-radius:10px;padding:6px;}"
-                "QMenu::item{padding:6px 14px;border-radius:8px;}"
-                "QMenu::item:selected{background:#2a2f3a;}"
-                "TitleBar{background:transparent;}"
-                "#titleMenuBtn{background:#151924;border:1px solid #2a2f3a;border-radius:8px;padding:0 10px;color:#e6e6e6;}"
-                "#titleMenuBtn:hover{background:#2a2f3a;}"
-                "#titleMenuBtn:disabled{background:#11161f;border:1px solid #222836;color:#6b7385;}"
-                "#titleMin{background:rgba(255,255,255,0.06);color:white;border-radius:8px;}"
-                "#titleMin:hover{background:rgba(255,255,255,0.10);}"
-                "#titleClose{background:#ef4444;color:white;border-radius:8px;}"
-                "#titleClose:hover{background:#dc2626;}"
-            )
-        else:
-            self.setStyleSheet(
-                "QWidget{color:#1f2328;}"
-                "QMainWindow{background:transparent;}"
-                "#root{background:rgba(246,247,251,210);border-radius:14px;}"
-                "QGroupBox{border:1px solid #d7dbe6;border-radius:8px;margin-top:12px;padding:8px;background:white;}"
-                "QGroupBox::title{subcontrol-origin: margin;subcontrol-position: top left;left:10px;top:0px;padding:0 6px;}"
-                "QLineEdit,QTextEdit,QComboBox{background:white;border:1px solid #d7dbe6;border-radius:6px;padding:6px;}"
-                "QPushButton{background:#2563eb;border:none;border-radius:8px;padding:8px 12px;color:white;}"
-                "QPushButton:disabled{background:#d7dbe6;color:#6b7280;}"
-                "QCheckBox{spacing:8px;}"
-                "QMenuBar{background:transparent;border:none;padding:2px;}"
-                "QMenuBar::item{background:transparent;padding:6px 10px;border-radius:8px;}"
-                "QMenuBar::item:selected{background:#ffffff;}"
-                "QMenu{background:#ffffff;border:1px solid #d7dbe6;border-radius:10px;padding:6px;}"
-                "QMenu::item{padding:6px 14px;border-radius:8px;}"
-                "QMenu::item:selected{background:#eef2ff;}"
-                "TitleBar{background:transparent;}"
-                "#titleMenuBtn{background:#ffffff;border:1px solid #d7dbe6;border-radius:8px;padding:0 10px;color:#111827;}"
-                "#titleMenuBtn:hover{background:#f3f4f6;}"
-                "#titleMenuBtn:disabled{background:#f3f4f6;border:1px solid #e5e7eb;color:#9ca3af;}"
-                "#titleMin{background:rgba(0,0,0,0.05);color:#111827;border-radius:8px;}"
-                "#titleMin:hover{background:rgba(0,0,0,0.08);}"
-                "#titleClose{background:#ef4444;color:white;border-radius:8px;}"
-                "#titleClose:hover{background:#dc2626;}"
-            )
+        self.setStyleSheet(style)
+        self._applied_qss = style
         self._apply_popup_menu_theme()
 
     def _apply_popup_menu_theme(self) -> None:
-        if self._theme == "dark":
-            menu_style = (
-                "QMenu{background:#151924;color:#e6e6e6;border:1px solid #2a2f3a;border-radius:10px;padding:6px;}"
-                "QMenu::item{padding:6px 14px;border-radius:8px;}"
-                "QMenu::item:selected{background:#2a2f3a;}"
-                "QMenu::separator{height:1px;background:#2a2f3a;margin:4px 10px;}"
-            )
-        else:
-            menu_style = (
-                "QMenu{background:#ffffff;color:#111827;border:1px solid #d7dbe6;border-radius:10px;padding:6px;}"
-                "QMenu::item{padding:6px 14px;border-radius:8px;}"
-                "QMenu::item:selected{background:#eef2ff;}"
-                "QMenu::separator{height:1px;background:#e5e7eb;margin:4px 10px;}"
-            )
-
+        style = self._MENU_QSS[self._theme]
+        if style is self._applied_menu_qss:
+            return
         for menu in (self.menu_settings, self.menu_language, self.menu_theme, self.menu_help):
-            menu.setStyleSheet(menu_style)
+            if menu.styleSheet() != style:
+                menu.setStyleSheet(style)
+        self._applied_menu_qss = style
 
     def _show_message(self, icon: QMessageBox.Icon, text: str) -> None:
-        box = QMessageBox(self)
+        box = self._msgbox_cache.get(self._theme)
+        if box is None:
+            box = QMessageBox(self)
+            box.setStandardButtons(QMessageBox.Ok)
+            box.setWindowModality(Qt.WindowModal)
+            box.setStyleSheet(self._message_box_style())
+            self._msgbox_cache[self._theme] = box
         box.setIcon(icon)
         box.setWindowTitle(self._t("app_title"))
         box.setText(text)
-        box.setStandardButtons(QMessageBox.Ok)
-        box.setWindowModality(Qt.WindowModal)
-        box.setStyleSheet(self._message_box_style())
         box.exec_()
 
     def _message_box_style(self) -> str:
-        if self._theme == "dark":
-            return (
-                "QMessageBox{background:#151924;color:#e6e6e6;}"
-                "QLabel{color:#e6e6e6;}"
-                "QPushButton{background:#1f6feb;border:none;border-radius:8px;padding:8px 12px;color:white;min-width:88px;}"
-            )
-        return (
-            "QMessageBox{background:#ffffff;color:#111827;}"
-            "QLabel{color:#111827;}"
-            "QPushButton{background:#2563eb;border:none;border-radius:8px;padding:8px 12px;color:white;min-width:88px;}"
-        )
+        return _MESSAGE_BOX_QSS[self._theme]
 
     def _set_language(self, code: str) -> None:
         if code != self._lang_code:
             self._load_language(code)
-        if code == "zh_CN":
-            self.act_lang_zh.setChecked(True)
-        else:
-            self.act_lang_en.setChecked(True)
+        act = self._lang_actions.get(code, self.act_lang_en)
+        if not act.isChecked():
+            act.setChecked(True)
 
     def _get_effective_theme(self) -> str:
         if self._theme_mode == "system":
             sys_theme = _read_windows_apps_theme()
+            self._last_sys_theme = sys_theme
             return sys_theme or "light"
         return self._theme_mode
 
@@ -757,31 +897,50 @@ class MainWindow(QMainWindow):
         if mode not in ("system", "light", "dark"):
             return
 
+        # Menu picks switch instantly.
         self._theme_mode = mode
         target = self._get_effective_theme()
-        if target == self._theme:
-            self._update_theme_checks()
-            return
-
-        self.setWindowOpacity(0.0)
-        self._apply_theme(target)
-        self._animate_fade(0.0, 1.0, duration_ms=220)
+        if target != self._theme:
+            self._apply_theme(target)
         self._update_theme_checks()
 
     def _update_theme_checks(self) -> None:
-        if self._theme_mode == "system":
-            self.act_theme_system.setChecked(True)
-        elif self._theme_mode == "dark":
-            self.act_theme_dark.setChecked(True)
-        else:
-            self.act_theme_light.setChecked(True)
+        act = self._theme_actions[self._theme_mode]
+        if not act.isChecked():
+            act.setChecked(True)
 
     def _poll_system_theme(self) -> None:
         if self._theme_mode != "system":
             return
-        target = self._get_effective_theme()
-        if target != self._theme:
-            self._apply_theme(target)
+        sys_theme = _read_windows_apps_theme()
+        if sys_theme == self._last_sys_theme:
+            return
+        self._last_sys_theme = sys_theme
+        target = sys_theme or "light"
+        if target == self._theme:
+            return
+
+        # The OS changed theme under us; soften the switch unless nobody can see it.
+        animate = self.isVisible() and not (self.windowState() & Qt.WindowMinimized)
+        if animate:
+            self.setWindowOpacity(0.0)
+        self._apply_theme(target)
+        if animate:
+            self._animate_fade(0.0, 1.0, duration_ms=120)
+
+    def nativeEvent(self, eventType, message):  # type: ignore[override]
+        if eventType == b"windows_generic_MSG":
+            try:
+                msg = wintypes.MSG.from_address(int(message))
+                if (
+                    msg.message == _WM_SETTINGCHANGE
+                    and msg.lParam
+                    and ctypes.wstring_at(msg.lParam) == "ImmersiveColorSet"
+                ):
+                    self._poll_system_theme()
+            except Exception:
+                pass
+        return super().nativeEvent(eventType, message)
 
     def _show_about(self) -> None:
         title = self._t("about_title")
@@ -789,30 +948,42 @@ class MainWindow(QMainWindow):
         dlg = AboutDialog(self, title=title, html=text, theme=self._theme)
         dlg.exec_()
 
+    def _open_file(self, name_filter: str) -> str:
+        path, _ = QFileDialog.getOpenFileName(self, "", self._last_dir, name_filter, options=QFileDialog.ReadOnly)
+        if path:
+            self._last_dir = os.path.dirname(path)
+        return path
+
+    def _open_dir(self, start: str = "") -> str:
+        path = QFileDialog.getExistingDirectory(self, "", start or self._last_dir)
+        if path:
+            self._last_dir = path
+        return path
+
     def _pick_py(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "", "", "Python (*.py)")
+        path = self._open_file("Python (*.py)")
         if path:
             self.ed_py.setText(path)
 
     def _pick_out(self) -> None:
-        path = QFileDialog.getExistingDirectory(self, "")
+        path = self._open_dir(self.ed_out.text().strip())
         if path:
             self.ed_out.setText(path)
             if not self.ed_distpath.text().strip():
                 self.ed_distpath.setText(path)
 
     def _pick_icon(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(self, "", "", "Icon (*.ico)")
+        path = self._open_file("Icon (*.ico)")
         if path:
             self.ed_icon.setText(path)
 
     def _pick_dir(self, target: QLineEdit) -> None:
-        path = QFileDialog.getExistingDirectory(self, "")
+        path = self._open_dir(target.text().strip())
         if path:
             target.setText(path)
 
-    def _sync_enabled_state(self, running: bool) -> None:
-        widgets = [
+    def _build_toggleable_widgets(self) -> None:
+        self._toggleable_widgets: Tuple[QWidget, ...] = (
             self.ed_py,
             self.btn_py,
             self.ed_out,
@@ -836,27 +1007,34 @@ class MainWindow(QMainWindow):
             self.btn_workpath,
             self.ed_distpath,
             self.btn_distpath,
-        ]
-        for w in widgets:
-            w.setEnabled(not running)
+        )
 
-        self.btn_start.setEnabled(not running)
-        self.btn_cancel.setEnabled(running)
+    def _sync_enabled_state(self, running: bool) -> None:
+        target = not running
+        for w in self._toggleable_widgets:
+            if w.isEnabled() != target:
+                w.setEnabled(target)
+
+        for w, enabled in (
+            (self.btn_start, target),
+            (self.btn_cancel, running),
+            (self.title_bar.btn_settings, target),
+            (self.title_bar.btn_help, target),
+        ):
+            if w.isEnabled() != enabled:
+                w.setEnabled(enabled)
 
         self.lbl_status.setText(self._t("status_running") if running else self._t("status_ready"))
         self._on_use_upx_toggled(self.ck_use_upx.isChecked())
 
-        self.title_bar.btn_settings.setEnabled(not running)
-        self.title_bar.btn_help.setEnabled(not running)
-
     def _validate(self) -> Optional[BuildOptions]:
         py_file = self.ed_py.text().strip()
         out_dir = self.ed_out.text().strip()
 
-        if not py_file.lower().endswith(".py") or not Path(py_file).exists():
+        if py_file[-3:].lower() != ".py" or not os.path.isfile(py_file):
             self._show_message(QMessageBox.Warning, self._t("msg_select_py"))
             return None
-        if not out_dir or not Path(out_dir).exists():
+        if not out_dir or not os.path.isdir(out_dir):
             self._show_message(QMessageBox.Warning, self._t("msg_select_output"))
             return None
 
@@ -897,23 +1075,13 @@ class MainWindow(QMainWindow):
         args.append("--onefile" if opt.mode_onefile else "--onedir")
         args.append("--windowed" if opt.windowed else "--console")
 
-        if opt.name:
-            args += ["--name", opt.name]
-        if opt.icon:
-            args += ["--icon", opt.icon]
-        if opt.uac_admin:
-            args.append("--uac-admin")
-        if opt.clean:
-            args.append("--clean")
-        if opt.noconfirm:
-            args.append("-y")
-
-        if opt.specpath:
-            args += ["--specpath", opt.specpath]
-        if opt.workpath:
-            args += ["--workpath", opt.workpath]
-        if opt.distpath:
-            args += ["--distpath", opt.distpath]
+        for attr, flag in _PAIR_OPTS:
+            value = getattr(opt, attr)
+            if value:
+                args += [flag, value]
+        for attr, flag in _BOOL_FLAGS:
+            if getattr(opt, attr):
+                args.append(flag)
 
         if opt.use_upx:
             args += ["--upx-dir", opt.upx_dir]
@@ -923,53 +1091,70 @@ class MainWindow(QMainWindow):
         args.append(opt.py_file)
         return args
 
+    def _append_lines(self, batch: str) -> None:
+        for line in batch.replace("\r\n", "\n").split("\n"):
+            self._append_line(line)
+
     def _append_line(self, line: str) -> None:
         is_error, friendly = self._analyze_error_line(line)
         if is_error and friendly:
-            self._append_html(f"<span style='color:#ef4444;'><b>{self._escape(line)}</b></span>")
-            self._append_html(f"<span style='color:#ef4444;'>{self._escape(friendly)}</span>")
+            self._append_entry((line, _FMT_ERROR_BOLD), (friendly, _FMT_ERROR))
             return
         if is_error:
-            self._append_html(f"<span style='color:#ef4444;'>{self._escape(line)}</span>")
+            self._append_plain(line, _FMT_ERROR)
         else:
-            self._append_html(self._escape(line))
+            self._append_plain(line)
 
-    def _append_html(self, html: str) -> None:
-        self.txt_log.append(html)
+    def _append_plain(self, text: str, fmt: QTextCharFormat = _FMT_PLAIN) -> None:
+        self._append_entry((text, fmt))
 
-    @staticmethod
-    def _escape(text: str) -> str:
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#39;")
-        )
+    def _append_entry(self, *lines: Tuple[str, QTextCharFormat]) -> None:
+        self._log_buffer.append(lines)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self) -> None:
+        if not self._log_buffer:
+            return
+        bar = self.txt_log.verticalScrollBar()
+        at_bottom = bar.value() == bar.maximum()
+
+        doc = self.txt_log.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for entry in self._log_buffer:
+            for text, fmt in entry:
+                if not doc.isEmpty():
+                    cursor.insertBlock()
+                cursor.insertText(text, fmt)
+        cursor.endEditBlock()
+        self._log_buffer.clear()
+
+        if at_bottom:
+            bar.setValue(bar.maximum())
+
+    def _clear_log(self) -> None:
+        self._log_flush_timer.stop()
+        self._log_buffer.clear()
+        self.txt_log.clear()
 
     def _analyze_error_line(self, line: str) -> Tuple[bool, str]:
         lower = line.lower()
-        if "modulenotfounderror" in lower or "no module named" in lower:
-            m = re.search(r"No module named ['\"]([^'\"]+)['\"]", line)
-            module = m.group(1) if m else ""
-            detail = line.strip()
-            msg = self._t("err_module_not_found").format(detail=detail, module=module or "<module>")
-            return True, msg
-
-        if "permissionerror" in lower or "access is denied" in lower:
-            detail = line.strip()
-            msg = self._t("err_permission").format(detail=detail)
-            return True, msg
-
-        if "syntaxerror" in lower:
-            detail = line.strip()
-            msg = self._t("err_syntax").format(detail=detail)
-            return True, msg
+        if _ERROR_TOKEN_RE.search(lower) is None:
+            return _NOT_AN_ERROR
 
-        if "error:" in lower or "traceback" in lower:
-            return True, ""
+        # Tokens are ordered by priority, so take the first one present.
+        key = next(k for token, k in _ERROR_TOKENS if token in lower)
+        if not key:
+            return _ERROR_WITHOUT_HINT
 
-        return False, ""
+        detail = line.strip()
+        if key == "err_module_not_found":
+            m = _MODULE_RE.search(line)
+            module = m.group(1) if m else ""
+            return True, self._err_formats[key].format(detail=detail, module=module or "<module>")
+        return True, self._err_formats[key].format(detail=detail)
 
     def _start(self) -> None:
         if self._worker:
@@ -983,23 +1168,21 @@ class MainWindow(QMainWindow):
             return
 
         args = self._build_args(opt)
-        self.txt_log.clear()
-        self._append_html(self._escape(" ".join(args)))
-        self._append_html(self._escape(""))
+        self._clear_log()
+        self._append_plain(" ".join(args))
+        self._append_plain("")
 
         cwd = str(Path(opt.py_file).resolve().parent)
-        self._worker = PyInstallerWorker(args=args, cwd=cwd)
-        self._worker.line.connect(self._append_line)
+        self._worker = PyInstallerWorker(args=args, cwd=cwd, parent=self)
+        self._worker.lines.connect(self._append_lines)
         self._worker.finished_with_code.connect(self._on_finished)
         self._sync_enabled_state(running=True)
         self._worker.start()
 
         if opt.use_upx:
             default_dir = _default_upx_dir()
-            if default_dir and (not self.ed_upx_dir.text().strip() or self.ed_upx_dir.text().strip() == default_dir):
-                self._append_html(
-                    f"<span style='color:#64748b;'>{self._escape(self._t('msg_note_upx_default').format(detail=default_dir))}</span>"
-                )
+            if default_dir and opt.upx_dir == default_dir:
+                self._append_plain(self._t("msg_note_upx_default").format(detail=default_dir), _FMT_NOTE)
 
     def _cancel(self) -> None:
         if self._worker:
@@ -1012,9 +1195,7 @@ class MainWindow(QMainWindow):
             self.lbl_status.setText(self._t("status_done"))
         else:
             self.lbl_status.setText(self._t("status_failed"))
-            self._append_html(
-                f"<span style='color:#ef4444;'><b>{self._escape(self._t('err_generic').format(detail=str(code)))}</b></span>"
-            )
+            self._append_plain(self._t("err_generic").format(detail=str(code)), _FMT_ERROR_BOLD)
 
         if self._worker:
             self._worker.deleteLater()
@@ -1030,34 +1211,41 @@ class MainWindow(QMainWindow):
                 self.ed_upx_dir.setText(default_dir)
 
     def dragEnterEvent(self, event) -> None:  # type: ignore[override]
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            if urls and urls[0].toLocalFile().lower().endswith(".py"):
-                event.acceptProposedAction()
+        self._drag_path = None
+        md = event.mimeData()
+        if not md.hasUrls():
+            return
+        urls = md.urls()
+        if not urls:
+            return
+        path = urls[0].toLocalFile()
+        if path[-3:].lower() == ".py":
+            self._drag_path = path
+            event.acceptProposedAction()
+
+    def dragLeaveEvent(self, event) -> None:  # type: ignore[override]
+        self._drag_path = None
+        super().dragLeaveEvent(event)
 
     def dropEvent(self, event) -> None:  # type: ignore[override]
-        if event.mimeData().hasUrls():
-            path = event.mimeData().urls()[0].toLocalFile()
-            if path.lower().endswith(".py"):
-                self.ed_py.setText(path)
+        path, self._drag_path = self._drag_path, None
+        if path:
+            self.ed_py.setText(path)
 
     def showEvent(self, event) -> None:  # type: ignore[override]
         super().showEvent(event)
-        if self._fade_anim is None:
+        if not self._did_fade_in:
+            self._did_fade_in = True
             self.setWindowOpacity(0.0)
             self._animate_fade(0.0, 1.0, duration_ms=260)
 
     def _animate_fade(self, start: float, end: float, duration_ms: int) -> None:
-        try:
-            anim = QPropertyAnimation(self, b"windowOpacity")
-            anim.setStartValue(start)
-            anim.setEndValue(end)
-            anim.setDuration(duration_ms)
-            anim.setEasingCurve(QEasingCurve.OutCubic)
-            anim.start()
-            self._fade_anim = anim
-        except Exception:
-            self.setWindowOpacity(end)
+        anim = self._fade_anim
+        anim.stop()
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        anim.setDuration(duration_ms)
+        anim.start()
 
 
 def main() -> int: